@@ -218,8 +218,8 @@ impl World {
     }
 
     pub fn column_by_id(&self, id: ComponentId) -> Option<ColumnRef<'_, &Vec<u8>>> {
-        let (schema, metadata) = self.metadata.component_map.get(&id).unwrap();
-        let column = self.host.get(&id).unwrap();
+        let (schema, metadata) = self.metadata.component_map.get(&id)?;
+        let column = self.host.get(&id)?;
         Some(ColumnRef {
             column: &column.buffer,
             entities: &column.entity_ids,
@@ -1,6 +1,7 @@
 # ruff: noqa: F403
 # ruff: noqa: F405
 import code
+import functools
 import inspect
 import re
 import readline
@@ -23,6 +24,7 @@ from typing import (
 
 import jax
 import numpy
+from jax.interpreters.partial_eval import dce_jaxpr
 from jax.tree_util import tree_flatten, tree_unflatten
 from typing_extensions import TypeVarTuple, Unpack
 
@@ -93,9 +95,6 @@ class Query(Generic[Unpack[A]]):
         out_tps: Union[Tuple[Annotated[Any, Component], ...], Annotated[Any, Component]],
         f: Callable[[Unpack[A]], Union[Tuple[Unpack[S]], T]],
     ) -> "Query[Unpack[S]]":
-        out_tps_tuple: Tuple[Annotated[Any, Component], ...] = (
-            (out_tps,) if not isinstance(out_tps, tuple) else out_tps
-        )
         buf = jax.vmap(
             lambda b: f(
                 *[from_array(cls, x) for (x, cls) in zip(b, self.component_classes)]  # type: ignore
@@ -103,12 +102,43 @@ class Query(Generic[Unpack[A]]):
             in_axes=0,
             out_axes=0,
         )(self.bufs)
+        return self._with_bufs(out_tps, buf)
+
+    def _map_const(
+        self,
+        out_tps: Union[Tuple[Annotated[Any, Component], ...], Annotated[Any, Component]],
+        f: Callable[[Unpack[A]], Union[Tuple[Unpack[S]], T]],
+    ) -> "Query[Unpack[S]]":
+        # `f` must not depend on its inputs, so evaluate it once on placeholders shaped like a
+        # single entity and broadcast the result instead of vmapping it over every entity.
+        def call(*bufs):
+            return f(*[from_array(cls, x) for (x, cls) in zip(bufs, self.component_classes)])  # type: ignore
+
+        placeholders = [jax.numpy.zeros(x.shape[1:], x.dtype) for x in self.bufs]
+        jaxpr = jax.make_jaxpr(call)(*placeholders).jaxpr
+        _, used_inputs = dce_jaxpr(jaxpr, [True] * len(jaxpr.outvars))
+        if any(used_inputs):
+            raise ValueError("const_map function depends on its inputs, use map instead")
+        n = self.bufs[0].shape[0]
+        buf = jax.tree_util.tree_map(
+            lambda v: jax.numpy.broadcast_to(v, (n, *jax.numpy.shape(v))), call(*placeholders)
+        )
+        return self._with_bufs(out_tps, buf)
+
+    def _with_bufs(
+        self,
+        out_tps: Union[Tuple[Annotated[Any, Component], ...], Annotated[Any, Component]],
+        buf: Any,
+    ) -> "Query[Any]":
+        out_tps_tuple: Tuple[Annotated[Any, Component], ...] = (
+            (out_tps,) if not isinstance(out_tps, tuple) else out_tps
+        )
         (bufs, _) = tree_flatten(buf)
         inner = None
         component_data = []
         component_classes = []
-        for out_tp, buf in zip(out_tps_tuple, bufs):
-            this_inner = self.inner.map(buf, Component.of(out_tp))  # type: ignore
+        for out_tp, out_buf in zip(out_tps_tuple, bufs):
+            this_inner = self.inner.map(out_buf, Component.of(out_tp))  # type: ignore
             if inner is None:
                 inner = this_inner
             else:
@@ -163,6 +193,17 @@ class Query(Generic[Unpack[A]]):
 def map(
     func: Callable[..., Union[Tuple[Annotated[Any, Component], ...], Annotated[Any, Component]]],
 ) -> System:
+    return _query_system(func, Query.map)
+
+
+# Like `map`, for functions whose output doesn't depend on their inputs, e.g. a constant force.
+def const_map(
+    func: Callable[..., Union[Tuple[Annotated[Any, Component], ...], Annotated[Any, Component]]],
+) -> System:
+    return _query_system(func, Query._map_const)
+
+
+def _query_system(func: Callable[..., Any], query_map: Callable[..., Query]) -> System:
     sig = inspect.signature(func)
     tys = list(sig.parameters.values())
     query = Query[tuple(ty.annotation for ty in tys)]  # type: ignore
@@ -172,11 +213,17 @@ def map(
 
     @system
     def inner(q: query) -> Query[return_ty]:  # type: ignore
-        return q.map(return_ty, func)
+        return query_map(q, return_ty, func)
 
     return inner
 
 
+def compose(*systems: System) -> System:
+    if not systems:
+        raise ValueError("compose requires at least one system")
+    return functools.reduce(lambda a, b: a.pipe(b), systems)
+
+
 def from_array(cls, arr):
     if hasattr(cls, "__origin__"):
         cls = cls.__origin__
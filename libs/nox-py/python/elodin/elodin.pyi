@@ -10,6 +10,7 @@ from typing import (
 )
 
 import jax
+import numpy as np
 import polars as pl
 
 from elodin import Archetype
@@ -44,6 +45,11 @@ class WorldBuilder:
         archetypes: Archetype | list[Archetype],
         name: Optional[str] = None,
     ) -> EntityId: ...
+    def spawn_batch(
+        self,
+        archetypes: Archetype | list[Archetype],
+        names: Optional[list[str]] = None,
+    ) -> list[EntityId]: ...
     def insert(self, id: EntityId, archetypes: Archetype | Sequence[Archetype]): ...
     def run(
         self,
@@ -245,6 +251,9 @@ class Impeller:
 
 class Exec:
     def run(self, ticks: int = 1, show_progress: bool = True): ...
+    def fork(self) -> Exec: ...
+    def set_column(self, component_name: str, value: jax.typing.ArrayLike): ...
+    def column_array(self, component_name: str) -> np.ndarray: ...
     def profile(self) -> dict[str, float]: ...
     def save_archive(self, path: str, format: str): ...
     def history(self, components: str | list[str]) -> pl.DataFrame: ...
@@ -1,3 +1,4 @@
+import jax
 from jax import numpy as np
 from jax.tree_util import register_pytree_node
 
@@ -71,6 +72,7 @@ class JaxSim:
             self.map = map
 
         self._tick_steps = 0  # Track total steps taken
+        self._run_steps = jax.jit(self._run_steps_inner, static_argnums=1)
 
         # Find tick component location (it's always present when SimulationTick is used)
         self._tick_index = None
@@ -127,16 +129,30 @@ class JaxSim:
         max_steps : int
             The maximum number of steps to simulate.
         """
-        for steps in range(max_steps):
+        self.state = self._run_steps(self.state, max_steps)
+        if self._tick_index is not None:
+            self._tick_steps += max_steps
+
+    def _run_steps_inner(self, state, max_steps):
+        """
+        Runs all steps inside a single `jax.lax.fori_loop`, so the whole batch is
+        dispatched to XLA once instead of once per step. Each component's shape must
+        stay the same from one step to the next.
+        """
+
+        def body(_, state):
             # Auto-increment tick if enabled
             if self._tick_index is not None:
                 # SimulationTick is always F64, just increment it
-                self.state[self._tick_index] = self.state[self._tick_index] + 1.0
-                self._tick_steps += 1
+                state = list(state)
+                state[self._tick_index] = state[self._tick_index] + 1.0
+
+            # Call the simulation function. The loop carry must keep its dtypes, so cast
+            # outputs back in case the system promoted any of them.
+            outputs = self.order_array(self.py_sim(*state))
+            return [np.asarray(out).astype(prev.dtype) for out, prev in zip(outputs, state)]
 
-            # Call the simulation function
-            self.state = self.py_sim(*self.state)
-            self.state = self.order_array(self.state)
+        return jax.lax.fori_loop(0, max_steps, body, state)
 
     def get_state(self, component_name=None, entity_name=None):
         """
@@ -0,0 +1,41 @@
+import os
+
+import elodin as el
+import jax
+import pytest
+
+# elodin is loaded as a pytest plugin, so jax is already imported by the time this runs. A
+# fixed path lets every xdist worker, and every later run, share one compilation cache.
+if not os.environ.get("JAX_COMPILATION_CACHE_DIR"):
+    jax.config.update(
+        "jax_compilation_cache_dir", os.path.join(os.path.dirname(__file__), ".jax_cache")
+    )
+# The test computations are small and compile quickly, so cache all of them instead of
+# only the ones over jax's default size and compile time thresholds.
+jax.config.update("jax_persistent_cache_min_entry_size_bytes", 0)
+jax.config.update("jax_persistent_cache_min_compile_time_secs", 0)
+
+
+def build_six_dof_exec(time_step, sys=None):
+    w = el.World()
+    w.spawn(el.Body(), "e1")
+    return w.build(el.six_dof(time_step, sys))
+
+
+@pytest.fixture(scope="session")
+def six_dof_exec_factory():
+    """
+    Builds each distinct `six_dof` system once per session and hands out fresh forks of it.
+
+    The world holds a single default `Body` named "e1"; tests set its initial state with
+    `Exec.set_column` before running.
+    """
+    execs = {}
+
+    def factory(time_step, sys=None):
+        key = (time_step, sys)
+        if key not in execs:
+            execs[key] = build_six_dof_exec(time_step, sys)
+        return execs[key].fork()
+
+    return factory
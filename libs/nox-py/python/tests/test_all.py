@@ -4,7 +4,9 @@ from dataclasses import dataclass
 import elodin as el
 import jax
 import jax.numpy as np
+import numpy
 import polars as pl
+import pytest
 from polars.testing import assert_frame_equal
 from elodin import ukf
 from jax import random
@@ -12,23 +14,95 @@ from jax import random
 X = ty.Annotated[jax.Array, el.Component("x", el.ComponentType.F64)]
 Y = ty.Annotated[jax.Array, el.Component("y", el.ComponentType.F64)]
 Effect = ty.Annotated[jax.Array, el.Component("e", el.ComponentType.F64)]
+X32 = ty.Annotated[jax.Array, el.Component("x32", el.ComponentType.F32)]
 
 E = ty.Annotated[el.Edge, el.Component("test_edge")]
 
+# Shared inputs, built once rather than in every test that spawns them.
+X_INIT = np.array([1.0, 15.0])
+Y_INIT = np.array([500.0, 500.0])
+ZERO_VEC = np.array([0.0, 0.0, 0.0])
+UNIT_X = np.array([1.0, 0.0, 0.0])
 
-def test_basic_system():
-    @el.system
-    def foo(x: el.Query[X]) -> el.Query[X]:
-        return x.map(X, lambda x: x * 2)
+# Expected world_pos values, kept as host numpy arrays since they are only compared against.
+SIX_DOF_ANGULAR = numpy.array([0.0, 0.0, 0.0, 1.0])
+SIX_DOF_LINEAR = numpy.array([0.01666667, 0.0, 0.0])
+SPATIAL_INTEGRATION_ANGULAR = numpy.array([0.97151626, 0.0, 0.0, 0.23697292])
+SPATIAL_INTEGRATION_LINEAR = numpy.array([2.0, 0.0, 0.0])
+# values from Julia and Simulink
+ANG_VEL_Z_POS = numpy.array([0.0, 0.0, 0.479425538604203, 0.8775825618903728, 0.0, 0.0, 0.0])
+ANG_VEL_Y_POS = numpy.array([0.0, 0.479425538604203, 0.0, 0.8775825618903728, 0.0, 0.0, 0.0])
+ANG_VEL_XY_POS = numpy.array(
+    [0.45936268493243, 0.45936268493243, 0.0, 0.76024459707606, 0.0, 0.0, 0.0]
+)
+# values taken from simulink
+CONSTANT_FORCE_POS = numpy.array([0.0, 0.0, 0.0, 1.0, 0.5, 0.0, 0.0])
+
+
+@el.system
+def foo(x: el.Query[X]) -> el.Query[X]:
+    return x.map(X, lambda x: x * 2)
+
+
+@el.system
+def bar(q: el.Query[X, Y]) -> el.Query[X]:
+    return q.map(X, lambda x, y: x * y)
+
+
+@el.map
+def baz(x: X, z: Effect) -> X:
+    return x + z
+
+
+@el.map
+def integrate_velocity(world_pos: el.WorldPos, world_vel: el.WorldVel) -> el.WorldPos:
+    linear = world_pos.linear() + world_vel.linear()
+    angular = world_pos.angular().integrate_body(world_vel.angular())
+    return el.SpatialTransform(linear=linear, angular=angular)
+
+
+@el.system
+def fold_test(graph: el.GraphQuery[E], x: el.Query[X32]) -> el.Query[X32]:
+    return graph.edge_fold(x, x, X32, np.array(5.0, dtype=np.float32), lambda x, a, b: x + a + b)
+
+
+@el.system
+def seed_mul(s: el.Query[el.Seed], q: el.Query[X]) -> el.Query[X]:
+    return q.map(X, lambda x: x * s[0])
+
+
+@el.system
+def seed_sample(s: el.Query[el.Seed], q: el.Query[X, Y]) -> el.Query[Y]:
+    def sample_inner(x, y):
+        key = random.key(s[0])
+        key = random.fold_in(key, x)
+        scaler = random.uniform(key, minval=1.0, maxval=2.0)
+        return y * scaler
+
+    return q.map(Y, sample_inner)
+
+
+@el.map
+def keep_tick(tick: el.SimulationTick) -> el.SimulationTick:
+    return tick
 
-    @el.system
-    def bar(q: el.Query[X, Y]) -> el.Query[X]:
-        return q.map(X, lambda x, y: x * y)
 
-    @el.map
-    def baz(x: X, z: Effect) -> X:
-        return x + z
+@el.system
+def add_tick(tick: el.Query[el.SimulationTick], x: el.Query[X]) -> el.Query[X]:
+    return x.map(X, lambda x: x + tick[0])
 
+
+@el.map
+def double_vec(v: el.WorldVel) -> el.WorldVel:
+    return v + v
+
+
+@el.const_map
+def constant_force(_: el.Force) -> el.Force:
+    return el.SpatialForce(linear=UNIT_X)
+
+
+def test_basic_system():
     @dataclass
     class Test(el.Archetype):
         x: X
@@ -38,21 +112,14 @@ def test_basic_system():
     class EffectArchetype(el.Archetype):
         e: Effect
 
-    sys = foo.pipe(bar).pipe(baz)
+    sys = el.compose(foo, bar, baz)
     w = el.World()
-    w.spawn(Test(np.array([1.0]), np.array([500.0])), "e1")
-    w.spawn(
-        [
-            Test(np.array([15.0]), np.array([500.0])),
-            EffectArchetype(np.array([15.0])),
-        ],
-        "e2",
-    )
+    _, e2 = w.spawn_batch(Test(X_INIT, Y_INIT), ["e1", "e2"])
+    w.insert(e2, EffectArchetype(np.array([15.0])))
     exec = w.build(sys)
     exec.run()
     exec.run()
     df = exec.history(["e1.x", "e2.x", "e1.y", "e2.y"])
-    print(df)
 
     expected_df = pl.DataFrame(
         {
@@ -65,41 +132,141 @@ def test_basic_system():
     assert_frame_equal(df.drop("time"), expected_df)
 
 
-def test_six_dof():
+def test_spawn_batch_errors():
+    @dataclass
+    class Test(el.Archetype):
+        x: X
+        y: Y
+
+    @dataclass
+    class VecArchetype(el.Archetype):
+        v: ty.Annotated[jax.Array, el.Component("v", el.ComponentType(el.PrimitiveType.F64, (3,)))]
+
     w = el.World()
-    w.spawn(
-        el.Body(
-            world_pos=el.SpatialTransform(linear=np.array([0.0, 0.0, 0.0])),
-            world_vel=el.SpatialMotion(linear=np.array([1.0, 0.0, 0.0])),
-            inertia=el.SpatialInertia(1.0),
-        ),
-        "e1",
+    with pytest.raises(ValueError, match="value size mismatch"):
+        w.spawn_batch(Test(X_INIT, np.array([500.0])))
+    # two rows' worth of elements, but not shaped (rows, 3)
+    with pytest.raises(ValueError, match="value size mismatch"):
+        w.spawn_batch(VecArchetype(np.zeros(6)))
+    with pytest.raises(ValueError, match="one name per spawned entity"):
+        w.spawn_batch(Test(X_INIT, Y_INIT), ["e1"])
+
+
+@pytest.mark.xdist_group("six_dof")
+def test_six_dof(six_dof_exec_factory):
+    exec = six_dof_exec_factory(1.0 / 60.0)
+    exec.set_column(
+        el.Component.name(el.WorldVel),
+        el.SpatialMotion(linear=UNIT_X).asarray(),
     )
-    sys = el.six_dof(1.0 / 60.0)
-    exec = w.build(sys)
     exec.run()
-    df = exec.history("e1.world_pos")
-    x = df["e1.world_pos"][-1]
-    assert np.allclose(x.to_numpy()[:4], np.array([0.0, 0.0, 0.0, 1.0]))
-    assert np.allclose(x.to_numpy()[4:], np.array([0.01666667, 0.0, 0.0]))
+    x = exec.column_array(el.Component.name(el.WorldPos))[0]
+    assert numpy.allclose(x[:4], SIX_DOF_ANGULAR)
+    assert numpy.allclose(x[4:], SIX_DOF_LINEAR)
 
 
-def test_spatial_integration():
-    @el.map
-    def integrate_velocity(world_pos: el.WorldPos, world_vel: el.WorldVel) -> el.WorldPos:
-        linear = world_pos.linear() + world_vel.linear()
-        angular = world_pos.angular().integrate_body(world_vel.angular())
-        return el.SpatialTransform(linear=linear, angular=angular)
+@pytest.mark.xdist_group("six_dof")
+def test_set_column_after_run(six_dof_exec_factory):
+    exec = six_dof_exec_factory(1.0 / 60.0)
+    exec.run(120)
+    exec.set_column(el.Component.name(el.WorldVel), el.SpatialMotion(linear=UNIT_X).asarray())
+    exec.run(60)
+    x = exec.column_array(el.Component.name(el.WorldPos))[0]
+    numpy.testing.assert_allclose(x[4:], UNIT_X, atol=1e-6)
+    # initial state, 120 ticks, the overwritten state and 60 more ticks
+    assert len(exec.history("e1.world_pos")) == 182
+
+
+def test_set_column_errors():
+    w = el.World()
+    w.spawn(el.Body(), "e1")
+    exec = w.build(double_vec)
+    world_vel = el.Component.name(el.WorldVel)
+    with pytest.raises(ValueError, match="value size mismatch"):
+        exec.set_column(world_vel, numpy.zeros(5))
+    with pytest.raises(ValueError, match="component not found"):
+        exec.set_column("not_a_component", numpy.zeros(6))
+    with pytest.raises(TypeError):
+        exec.set_column(world_vel, numpy.zeros(6, dtype=numpy.complex128))
+
+
+def test_unknown_component():
+    w = el.World()
+    w.spawn(el.Body(), "e1")
+    exec = w.build(double_vec)
+    with pytest.raises(ValueError, match="component not found"):
+        exec.column_array("not_a_component")
+
+
+def test_const_map():
+    @dataclass
+    class Test(el.Archetype):
+        x: X
+        y: Y
+
+    def set_y(_: X) -> Y:
+        return np.array(2.5)
+
+    def run_y(sys):
+        w = el.World()
+        w.spawn_batch(Test(np.array([1.0, 2.0, 3.0]), np.zeros(3)), ["e1", "e2", "e3"])
+        exec = w.build(sys)
+        exec.run()
+        return exec.column_array("y")
+
+    const_y = run_y(el.const_map(set_y))
+    assert numpy.array_equal(const_y, run_y(el.map(set_y)))
+    assert numpy.array_equal(const_y, numpy.full(3, 2.5))
+
+
+def test_const_map_empty_query():
+    @dataclass
+    class XArchetype(el.Archetype):
+        x: X
+        e: Effect
+
+    @dataclass
+    class YArchetype(el.Archetype):
+        y: Y
+        e: Effect
+
+    @el.const_map
+    def set_effect(_x: X, _y: Y) -> Effect:
+        return np.array(1.0)
+
+    w = el.World()
+    w.spawn(XArchetype(np.array([1.0]), np.array([0.0])), "e1")
+    w.spawn(YArchetype(np.array([1.0]), np.array([0.0])), "e2")
+    exec = w.build(set_effect)
+    exec.run()
+    assert (exec.column_array("e") == 0.0).all()
 
+
+def test_const_map_rejects_input_dependence():
+    @dataclass
+    class XArchetype(el.Archetype):
+        x: X
+
+    @el.const_map
+    def double_x(x: X) -> X:
+        return x * 2
+
+    w = el.World()
+    w.spawn(XArchetype(np.array([1.0])), "e1")
+    with pytest.raises(ValueError, match="depends on its inputs"):
+        w.build(double_x)
+
+
+def test_spatial_integration():
     sys = integrate_velocity
     w = el.World()
     w.spawn(
         el.Body(
             world_pos=el.SpatialTransform(
-                linear=np.array([0.0, 0.0, 0.0]),
+                linear=ZERO_VEC,
             ),
             world_vel=el.SpatialMotion(
-                linear=np.array([1.0, 0.0, 0.0]),
+                linear=UNIT_X,
                 angular=np.array([np.pi / 2, 0.0, 0.0]),
             ),
             inertia=el.SpatialInertia(1.0),
@@ -109,63 +276,38 @@ def test_spatial_integration():
     exec = w.build(sys)
     exec.run()
     exec.run()
-    df = exec.history("e1.world_pos")
-    pos = df["e1.world_pos"][-1]
-    assert (pos[4:] == [2.0, 0.0, 0.0]).all()
-    assert np.allclose(pos.to_numpy()[:4], np.array([0.97151626, 0.0, 0.0, 0.23697292]))
+    pos = exec.column_array(el.Component.name(el.WorldPos))[0]
+    numpy.testing.assert_array_equal(pos[4:], SPATIAL_INTEGRATION_LINEAR)
+    assert numpy.allclose(pos[:4], SPATIAL_INTEGRATION_ANGULAR)
 
 
 def test_graph():
     @dataclass
     class Test(el.Archetype):
-        x: X
+        x: X32
 
     @dataclass
     class EdgeArchetype(el.Archetype):
         edge: E
 
-    @el.system
-    def fold_test(graph: el.GraphQuery[E], x: el.Query[X]) -> el.Query[X]:
-        return graph.edge_fold(x, x, X, np.array(5.0), lambda x, a, b: x + a + b)
-
     w = el.World()
-    a = w.spawn(Test(np.array([1.0])), "e1")
-    b = w.spawn(Test(np.array([2.0])), "e2")
-    c = w.spawn(Test(np.array([2.0])), "e3")
-    print(a, b, c)
+    a = w.spawn(Test(np.array([1.0], dtype=np.float32)), "e1")
+    b = w.spawn(Test(np.array([2.0], dtype=np.float32)), "e2")
+    c = w.spawn(Test(np.array([2.0], dtype=np.float32)), "e3")
     w.spawn(EdgeArchetype(el.Edge(a, b)))
     w.spawn(EdgeArchetype(el.Edge(a, c)))
     w.spawn(EdgeArchetype(el.Edge(b, c)))
     exec = w.build(fold_test)
     exec.run()
-    df = exec.history(["e1.x", "e2.x", "e3.x"])
-    expected_df = pl.DataFrame({"e1.x": [1.0, 11.0], "e2.x": [2.0, 9.0], "e3.x": [2.0, 2.0]})
+    df = exec.history(["e1.x32", "e2.x32", "e3.x32"])
+    expected_df = pl.DataFrame(
+        {"e1.x32": [1.0, 11.0], "e2.x32": [2.0, 9.0], "e3.x32": [2.0, 2.0]},
+        schema={"e1.x32": pl.Float32, "e2.x32": pl.Float32, "e3.x32": pl.Float32},
+    )
     assert_frame_equal(df.drop("time"), expected_df)
 
 
 def test_seed():
-    @el.system
-    def foo(x: el.Query[X]) -> el.Query[X]:
-        return x.map(X, lambda x: x * 2)
-
-    @el.system
-    def bar(q: el.Query[X, Y]) -> el.Query[X]:
-        return q.map(X, lambda x, y: x * y)
-
-    @el.system
-    def seed_mul(s: el.Query[el.Seed], q: el.Query[X]) -> el.Query[X]:
-        return q.map(X, lambda x: x * s[0])
-
-    @el.system
-    def seed_sample(s: el.Query[el.Seed], q: el.Query[X, Y]) -> el.Query[Y]:
-        def sample_inner(x, y):
-            key = random.key(s[0])
-            key = random.fold_in(key, x)
-            scaler = random.uniform(key, minval=1.0, maxval=2.0)
-            return y * scaler
-
-        return q.map(Y, sample_inner)
-
     @dataclass
     class Globals(el.Archetype):
         seed: el.Seed
@@ -175,11 +317,10 @@ def test_seed():
         x: X
         y: Y
 
-    sys = foo.pipe(bar).pipe(seed_mul).pipe(seed_sample)
+    sys = el.compose(foo, bar, seed_mul, seed_sample)
     w = el.World()
     w.spawn(Globals(seed=np.array(2)))
-    w.spawn(Test(np.array(1.0), np.array(500.0)), "e1")
-    w.spawn(Test(np.array(15.0), np.array(500.0)), "e2")
+    w.spawn_batch(Test(X_INIT, Y_INIT), ["e1", "e2"])
     exec = w.build(sys)
     exec.run()
     df = exec.history(["e1.x", "e2.x", "e1.y", "e2.y"])
@@ -193,6 +334,31 @@ def test_seed():
     assert e2y >= 500.0 and e2y <= 1000.0
 
 
+def test_jax_sim_step():
+    @dataclass
+    class Test(el.Archetype):
+        x: X
+
+    def build():
+        w = el.World()
+        w.spawn(Test(np.array([1.0])), "e1")
+        return w.to_jax(el.compose(keep_tick, add_tick))
+
+    batched = build()
+    batched.step(3)
+    single = build()
+    for _ in range(3):
+        single.step(1)
+
+    for sim in (batched, single):
+        assert sim.get_tick_count() == 3
+        numpy.testing.assert_array_equal(sim.get_state("tick"), [3.0])
+        # x picks up the tick after every increment: 1 + 1 + 2 + 3
+        numpy.testing.assert_array_equal(sim.get_state("x", "e1"), 7.0)
+    for a, b in zip(batched.get_state(), single.get_state()):
+        numpy.testing.assert_array_equal(a, b)
+
+
 def test_archetype_name():
     @dataclass
     class TestArchetype(el.Archetype):
@@ -203,12 +369,8 @@ def test_archetype_name():
 
 
 def test_spatial_vector_algebra():
-    @el.map
-    def double_vec(v: el.WorldVel) -> el.WorldVel:
-        return v + v
-
     w = el.World()
-    w.spawn(el.Body(world_vel=el.SpatialMotion(linear=np.array([1.0, 0.0, 0.0]))), "e1")
+    w.spawn(el.Body(world_vel=el.SpatialMotion(linear=UNIT_X)), "e1")
     exec = w.build(double_vec)
     exec.run()
     df = exec.history("e1.world_vel")
@@ -226,74 +388,28 @@ def test_spatial_vector_algebra():
     assert_frame_equal(df.drop("time"), expected_df)
 
 
-def test_six_dof_ang_vel_int():
-    w = el.World()
-    w.spawn(
-        el.Body(
-            world_pos=el.SpatialTransform(linear=np.array([0.0, 0.0, 0.0])),
-            world_vel=el.SpatialMotion(angular=np.array([0.0, 0.0, 1.0])),
-            inertia=el.SpatialInertia(1.0),
-        ),
-        "e1",
+@pytest.mark.xdist_group("six_dof")
+@pytest.mark.parametrize(
+    "angular,expected",
+    [
+        (np.array([0.0, 0.0, 1.0]), ANG_VEL_Z_POS),
+        (np.array([0.0, 1.0, 0.0]), ANG_VEL_Y_POS),
+        (np.array([1.0, 1.0, 0.0]), ANG_VEL_XY_POS),
+    ],
+)
+def test_six_dof_ang_vel_int(six_dof_exec_factory, angular, expected):
+    exec = six_dof_exec_factory(1.0 / 120.0)
+    exec.set_column(
+        el.Component.name(el.WorldVel),
+        el.SpatialMotion(angular=angular).asarray(),
     )
-    sys = el.six_dof(1.0 / 120.0)
-    exec = w.build(sys)
     exec.run(120)
-    df = exec.history("e1.world_pos")
-    x = df["e1.world_pos"][-1]
-    # value from Julia and Simulink
-    assert np.isclose(
-        x.to_numpy(),
-        np.array([0.0, 0.0, 0.479425538604203, 0.8775825618903728, 0.0, 0.0, 0.0]),
-        rtol=1e-5,
-    ).all()
-
-    w = el.World()
-    w.spawn(
-        el.Body(
-            world_pos=el.SpatialTransform(linear=np.array([0.0, 0.0, 0.0])),
-            world_vel=el.SpatialMotion(angular=np.array([0.0, 1.0, 0.0])),
-            inertia=el.SpatialInertia(1.0),
-        ),
-        "e1",
-    )
-    sys = el.six_dof(1.0 / 120.0)
-    exec = w.build(sys)
-    exec.run(120)
-    df = exec.history("e1.world_pos")
-    x = df["e1.world_pos"][-1]
-    # value from Julia and Simulink
-    assert np.isclose(
-        x.to_numpy(),
-        np.array([0.0, 0.479425538604203, 0.0, 0.8775825618903728, 0.0, 0.0, 0.0]),
-        rtol=1e-5,
-    ).all()
-
-    w = el.World()
-    w.spawn(
-        el.Body(
-            world_pos=el.SpatialTransform(linear=np.array([0.0, 0.0, 0.0])),
-            world_vel=el.SpatialMotion(angular=np.array([1.0, 1.0, 0.0])),
-            inertia=el.SpatialInertia(1.0),
-        ),
-        "e1",
-    )
-    sys = el.six_dof(1.0 / 120.0)
-    exec = w.build(sys)
-    exec.run(120)
-    df = exec.history("e1.world_pos")
-    x = df["e1.world_pos"][-1]
-    print(x.to_numpy())
-    # value from Julia and Simulink
-    assert np.isclose(
-        x.to_numpy(),
-        np.array([0.45936268493243, 0.45936268493243, 0.0, 0.76024459707606, 0.0, 0.0, 0.0]),
-        rtol=1e-5,
-    ).all()
+    x = exec.column_array(el.Component.name(el.WorldPos))[0]
+    assert numpy.allclose(x, expected, rtol=1e-5)
 
 
 # def test_six_dof_torque():
-#     @el.map
+#     @el.const_map
 #     def constant_torque(_: el.Force) -> el.Force:
 #         return el.SpatialForce(torque=np.array([1.0, 0.0, 0.0]))
 
@@ -316,53 +432,35 @@ def test_six_dof_ang_vel_int():
 #     exec = w.build(sys)
 #     for _ in range(120):
 #         exec.run()
-#     x = exec.column_array(el.Component.id(el.WorldPos))
+#     x = exec.column_array(el.Component.name(el.WorldPos))
 #     assert np.isclose(
-#         x.to_numpy()[0],
+#         x[0],
 #         np.array([0.24740395925454, 0.0, 0.0, 0.96891242171064, 0.0, 0.0, 0.0]),
 #         rtol=1e-5,
 #     ).all()  # values taken from simulink
-#     x = exec.column_array(el.Component.id(el.WorldVel))
+#     x = exec.column_array(el.Component.name(el.WorldVel))
 #     assert np.isclose(
-#         x.to_numpy()[0], np.array([1.0, 0.0, 0.0, 0.0, 0.0, 0.0]), rtol=1e-5
+#         x[0], np.array([1.0, 0.0, 0.0, 0.0, 0.0, 0.0]), rtol=1e-5
 #     ).all()  # values taken from simulink
 
-#     x = exec.column_array(el.Component.id(el.WorldPos))
-#     print(x.to_numpy()[1])
+#     x = exec.column_array(el.Component.name(el.WorldPos))
 #     assert np.isclose(
-#         x.to_numpy()[1],
+#         x[1],
 #         np.array([0.47942553860408, 0.0, 0.0, 0.87758256189044, 0.0, 0.0, 0.0]),
 #         rtol=1e-4,
 #     ).all()  # values taken from simulink
-#     x = exec.column_array(el.Component.id(el.WorldVel))
+#     x = exec.column_array(el.Component.name(el.WorldVel))
 #     assert np.isclose(
-#         x.to_numpy()[1], np.array([2.0, 0.0, 0.0, 0.0, 0.0, 0.0]), rtol=1e-5
+#         x[1], np.array([2.0, 0.0, 0.0, 0.0, 0.0, 0.0]), rtol=1e-5
 #     ).all()  # values taken from simulink
 
 
-def test_six_dof_force():
-    w = el.World()
-    w.spawn(
-        el.Body(
-            world_pos=el.SpatialTransform(linear=np.array([0.0, 0.0, 0.0])),
-            world_vel=el.SpatialMotion(angular=np.array([0.0, 0.0, 0.0])),
-            inertia=el.SpatialInertia(1.0),
-        ),
-        "e1",
-    )
-
-    @el.map
-    def constant_force(_: el.Force) -> el.Force:
-        print("constant force")
-        return el.SpatialForce(linear=np.array([1.0, 0.0, 0.0]))
-
-    sys = el.six_dof(1.0 / 120.0, constant_force)
-    exec = w.build(sys)
+@pytest.mark.xdist_group("six_dof")
+def test_six_dof_force(six_dof_exec_factory):
+    exec = six_dof_exec_factory(1.0 / 120.0, constant_force)
     exec.run(120)
-    df = exec.history(["e1.world_pos", "e1.world_vel", "e1.world_accel"])
-    assert np.isclose(
-        df["e1.world_pos"][-1].to_numpy(), np.array([0.0, 0.0, 0.0, 1.0, 0.5, 0.0, 0.0]), rtol=1e-5
-    ).all()  # values taken from simulink
+    x = exec.column_array(el.Component.name(el.WorldPos))[0]
+    assert numpy.allclose(x, CONSTANT_FORCE_POS, rtol=1e-5)
 
 
 def test_skew():
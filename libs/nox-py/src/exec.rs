@@ -5,7 +5,9 @@ use crate::*;
 use impeller2::types::Timestamp;
 use impeller2_wkt::ArchiveFormat;
 use indicatif::{ProgressBar, ProgressDrawTarget, ProgressStyle};
-use nox_ecs::Compiled;
+use nox_ecs::utils::PrimTypeExt;
+use nox_ecs::{Compiled, World};
+use numpy::PyUntypedArray;
 use pyo3::exceptions::PyTypeError;
 use pyo3::types::IntoPyDict;
 
@@ -13,6 +15,62 @@ use pyo3::types::IntoPyDict;
 pub struct Exec {
     pub exec: nox_ecs::WorldExec<Compiled>,
     pub db: elodin_db::DB,
+    // Declared after `db` so the database is closed before its directory is removed.
+    _db_dir: tempfile::TempDir,
+    initial_world: World,
+    last_timestamp: Timestamp,
+}
+
+impl Exec {
+    pub fn new(mut exec: nox_ecs::WorldExec<Compiled>) -> Result<Self, Error> {
+        let db_dir = tempfile::tempdir()?;
+        let timestamp = Timestamp::now();
+        let db = create_db(db_dir.path(), &mut exec.world, timestamp)?;
+        let initial_world = exec.world.clone();
+        Ok(Self {
+            exec,
+            db,
+            _db_dir: db_dir,
+            initial_world,
+            last_timestamp: timestamp,
+        })
+    }
+
+    /// Replaces the history with a fresh database holding only the current world.
+    fn reset_db(&mut self) -> Result<(), Error> {
+        let db_dir = tempfile::tempdir()?;
+        let timestamp = Timestamp::now();
+        self.db = create_db(db_dir.path(), &mut self.exec.world, timestamp)?;
+        self._db_dir = db_dir;
+        self.last_timestamp = timestamp;
+        Ok(())
+    }
+
+    /// Returns the timestamp to commit the next world state at.
+    ///
+    /// History has to be written in order, but `run` lays ticks out a time
+    /// step apart, which can put the last entry ahead of the wall clock.
+    fn next_timestamp(&self) -> Timestamp {
+        Timestamp::now().max(self.last_timestamp + self.exec.world.sim_time_step().0)
+    }
+
+    fn commit_world_head(&mut self, timestamp: Timestamp) -> Result<(), Error> {
+        self.db.with_state(|state| {
+            nox_ecs::impeller2_server::commit_world_head(state, &mut self.exec, timestamp)
+        })?;
+        self.last_timestamp = timestamp;
+        Ok(())
+    }
+}
+
+fn create_db(
+    db_dir: &std::path::Path,
+    world: &mut World,
+    timestamp: Timestamp,
+) -> Result<elodin_db::DB, Error> {
+    let db = elodin_db::DB::create(db_dir.join("db"))?;
+    nox_ecs::impeller2_server::init_db(&db, world, timestamp)?;
+    Ok(db)
 }
 
 #[pymethods]
@@ -35,12 +93,10 @@ impl Exec {
             .with_style(
                 ProgressStyle::with_template("{bar:50} {pos:>6}/{len:6} remaining: {eta}").unwrap(),
             );
-        let mut timestamp = Timestamp::now();
+        let mut timestamp = self.next_timestamp();
         for _ in 0..ticks {
             self.exec.run()?;
-            self.db.with_state(|state| {
-                nox_ecs::impeller2_server::commit_world_head(state, &mut self.exec, timestamp)
-            })?;
+            self.commit_world_head(timestamp)?;
             timestamp += self.exec.world.sim_time_step().0;
             py.check_signals()?;
             progress_bar.inc(1);
@@ -49,6 +105,72 @@ impl Exec {
         Ok(())
     }
 
+    /// Returns a copy of this exec reset to the state it was built with.
+    ///
+    /// The copy shares the compiled tick function, so forking is much cheaper
+    /// than building the same system again.
+    pub fn fork(&self) -> Result<Exec, Error> {
+        let mut exec = self.exec.fork();
+        exec.world = self.initial_world.clone();
+        Exec::new(exec)
+    }
+
+    /// Overwrites every entity's value of a component, in spawn order.
+    ///
+    /// `value` is cast to the component's type if numpy allows it as a
+    /// "same_kind" cast, and must hold exactly one value per entity.
+    ///
+    /// Before the first tick this also resets the history, so the new values
+    /// become the initial state of the simulation.
+    pub fn set_column(
+        &mut self,
+        py: Python<'_>,
+        component_name: String,
+        value: PyObject,
+    ) -> Result<(), Error> {
+        let component_id = ComponentId::new(&component_name);
+        let mut column = self
+            .exec
+            .world
+            .column_by_id_mut(component_id)
+            .ok_or(nox_ecs::Error::ComponentNotFound)?;
+        let prim_ty = column.schema.prim_type;
+        let dtype = nox::jax::dtype(&prim_ty.to_element_type())?;
+        // Only allow casts numpy considers "same_kind", so e.g. floats can't be truncated
+        // into an integer column.
+        let numpy = py.import("numpy")?;
+        let arr = numpy.call_method1("asarray", (value,))?.call_method(
+            "astype",
+            (dtype,),
+            Some(&[("casting", "same_kind")].into_py_dict(py)?),
+        )?;
+        let arr = numpy.call_method1("ascontiguousarray", (arr,))?;
+        let arr = arr.downcast_into::<PyUntypedArray>().map_err(PyErr::from)?;
+        let buf = unsafe { arr.buf(prim_ty.size()) };
+        if buf.len() != column.column.len() {
+            return Err(nox_ecs::Error::ValueSizeMismatch.into());
+        }
+        column.column.copy_from_slice(buf);
+        if self.exec.tick() == 0 {
+            self.reset_db()
+        } else {
+            self.commit_world_head(self.next_timestamp())
+        }
+    }
+
+    /// Returns the current value of a component for every entity, in spawn order.
+    ///
+    /// Unlike `history`, this reads the host column directly instead of going
+    /// through the database.
+    pub fn column_array(&self, py: Python<'_>, component_name: String) -> Result<PyObject, Error> {
+        let column = self
+            .exec
+            .world
+            .column_by_id(ComponentId::new(&component_name))
+            .ok_or(nox_ecs::Error::ComponentNotFound)?;
+        column_to_numpy(py, &column)
+    }
+
     pub fn profile(&self) -> HashMap<&'static str, f64> {
         self.exec.profile()
     }
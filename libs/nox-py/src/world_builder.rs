@@ -2,11 +2,13 @@ use crate::*;
 use ::s10::{GroupRecipe, SimRecipe, cli::run_recipe};
 use clap::Parser;
 use convert_case::Casing;
-use impeller2::types::{PrimType, Timestamp};
+use impeller2::types::PrimType;
 use impeller2_wkt::{ComponentMetadata, EntityMetadata};
 use miette::miette;
-use nox_ecs::{ComponentSchema, IntoSystem, System as _, TimeStep, World, increment_sim_tick, nox};
-use numpy::{PyArray, PyArrayMethods, ndarray::IntoDimension};
+use nox_ecs::{
+    ColumnRef, ComponentSchema, IntoSystem, System as _, TimeStep, World, increment_sim_tick, nox,
+};
+use numpy::{PyArray, PyArrayMethods, PyUntypedArrayMethods, ndarray::IntoDimension};
 use pyo3::{
     IntoPyObjectExt,
     types::{PyDict, PyList},
@@ -16,6 +18,7 @@ use std::{
     iter,
     net::SocketAddr,
     path::PathBuf,
+    sync::OnceLock,
     time,
 };
 use tracing::{error, info};
@@ -72,6 +75,20 @@ impl WorldBuilder {
     }
 }
 
+/// Returns a handle to the process-wide CPU client.
+///
+/// Creating a PJRT client initializes the XLA runtime, so it is done once and
+/// every exec built afterwards shares it. Clones keep their own compile
+/// options, so disabling optimizations for one exec does not affect others.
+fn cpu_client() -> Result<nox::Client, Error> {
+    static CPU_CLIENT: OnceLock<nox::Client> = OnceLock::new();
+    if let Some(client) = CPU_CLIENT.get() {
+        return Ok(client.clone());
+    }
+    let client = nox::Client::cpu()?;
+    Ok(CPU_CLIENT.get_or_init(|| client).clone())
+}
+
 fn is_snake_case(s: &str) -> bool {
     // This may look dumb and it is, but the [`is_case()` implementation][1] is
     // no better and less expressive in that you can't express boundaries.
@@ -103,69 +120,62 @@ impl WorldBuilder {
         };
         self.insert(entity_id, spawnable)?;
         self.world.metadata.entity_len += 1;
-        let derived_id = match (&name, id) {
-            (Some(name), None) => {
-                let new_id = name
-                    .without_boundaries(&convert_case::Boundary::digits())
-                    .to_case(convert_case::Case::Snake);
-                eprintln!("convert name {:?} to ID {:?}", &name, &new_id);
-                info!("convert name {:?} to ID {:?}", &name, &new_id);
-                Some(new_id)
-            }
-            (_, Some(id)) => Some(id),
-            _ => None,
-        };
-
-        if let Some(derived_id) = derived_id {
-            if !is_snake_case(&derived_id) {
-                error!("the ID should be snake_case but was {:?}", derived_id);
-            }
-            self.world.metadata.entity_metadata.insert(
-                entity_id.inner,
-                EntityMetadata {
-                    entity_id: entity_id.inner,
-                    // TODO: Consider changing this `name` field to `id`.
-                    // Perhaps add a human-readable field `display_name` or
-                    // `name` after that.
-                    name: derived_id,
-                    metadata: Default::default(),
-                },
-            );
-        }
+        self.set_entity_id(entity_id, name, id);
         Ok(entity_id)
     }
 
-    pub fn insert(&mut self, entity_id: EntityId, spawnable: Spawnable) -> Result<(), Error> {
-        match spawnable {
-            Spawnable::Archetypes(archetypes) => {
-                for archetype in archetypes {
-                    for (arr, component) in archetype.arrays.iter().zip(archetype.component_data) {
-                        let component_id = ComponentId::new(&component.name);
-                        let metadata = ComponentMetadata {
-                            component_id,
-                            name: component.name.clone(),
-                            metadata: component.metadata.clone(),
-                        };
-
-                        self.world.metadata.component_map.insert(
-                            component_id,
-                            (ComponentSchema::from(component.clone()), metadata),
-                        );
-                        let buffer = self.world.host.entry(component_id).or_default();
-                        let ty = component.ty.unwrap();
-                        let prim_ty: PrimType = ty.ty.into();
-                        let size = prim_ty.size();
-                        let buf = unsafe { arr.buf(size) };
-                        buffer.buffer.extend_from_slice(buf);
-                        buffer
-                            .entity_ids
-                            .extend_from_slice(&entity_id.inner.0.to_le_bytes());
-                        self.world.dirty_components.insert(component_id);
-                    }
+    /// Spawns one entity per row of the archetype's stacked component arrays.
+    ///
+    /// Each component column is copied into the world in one pass, instead of
+    /// once per entity as with repeated calls to `spawn`.
+    #[pyo3(signature = (spawnable, names=None))]
+    pub fn spawn_batch(
+        &mut self,
+        spawnable: Spawnable,
+        names: Option<Vec<String>>,
+    ) -> Result<Vec<EntityId>, Error> {
+        let Spawnable::Archetypes(archetypes) = &spawnable;
+        let mut len = None;
+        for archetype in archetypes {
+            for (arr, component) in archetype.arrays.iter().zip(&archetype.component_data) {
+                let ty = component.ty.as_ref().unwrap();
+                // Each array must be `(rows, *component_shape)`.
+                let shape = arr.shape();
+                let rows = shape.first().copied().unwrap_or_default();
+                let row_shape_matches = shape.len() == ty.shape.len() + 1
+                    && shape[1..]
+                        .iter()
+                        .zip(&ty.shape)
+                        .all(|(&dim, &expected)| dim as u64 == expected);
+                if !row_shape_matches || *len.get_or_insert(rows) != rows {
+                    return Err(nox_ecs::Error::ValueSizeMismatch.into());
                 }
-                Ok(())
             }
         }
+        let len = len.unwrap_or_default() as u64;
+        if names
+            .as_ref()
+            .is_some_and(|names| names.len() as u64 != len)
+        {
+            return Err(PyValueError::new_err("expected one name per spawned entity").into());
+        }
+
+        let first_entity_id = self.world.entity_len();
+        self.insert_rows(first_entity_id, len, spawnable)?;
+        self.world.metadata.entity_len += len;
+        let entity_ids = (first_entity_id..first_entity_id + len)
+            .map(|id| EntityId {
+                inner: impeller2::types::EntityId(id),
+            })
+            .collect::<Vec<_>>();
+        for (&entity_id, name) in entity_ids.iter().zip(names.into_iter().flatten()) {
+            self.set_entity_id(entity_id, Some(name), None);
+        }
+        Ok(entity_ids)
+    }
+
+    pub fn insert(&mut self, entity_id: EntityId, spawnable: Spawnable) -> Result<(), Error> {
+        self.insert_rows(entity_id.inner.0, 1, spawnable)
     }
 
     fn recipe(&mut self, py: Python<'_>, recipe_obj: PyObject) -> PyResult<()> {
@@ -232,7 +242,7 @@ impl WorldBuilder {
                     default_playback_speed,
                     max_ticks,
                 )?;
-                let mut client = nox::Client::cpu()?;
+                let mut client = cpu_client()?;
                 if !optimize {
                     client.disable_optimizations();
                 }
@@ -341,16 +351,12 @@ impl WorldBuilder {
             default_playback_speed,
             max_ticks,
         )?;
-        let mut client = nox::Client::cpu()?;
+        let mut client = cpu_client()?;
         if !optimize {
             client.disable_optimizations();
         }
-        let mut exec = exec.compile(client.clone())?;
-        let db_dir = tempfile::tempdir()?;
-        let db_dir = db_dir.into_path();
-        let db = elodin_db::DB::create(db_dir.join("db"))?;
-        nox_ecs::impeller2_server::init_db(&db, &mut exec.world, Timestamp::now())?;
-        Ok(Exec { exec, db })
+        let exec = exec.compile(client.clone())?;
+        Exec::new(exec)
     }
 
     #[allow(clippy::too_many_arguments)]
@@ -590,6 +596,78 @@ impl WorldBuilder {
 }
 
 impl WorldBuilder {
+    /// Appends `len` consecutive entities, starting at `first_entity_id`, whose
+    /// component values are stored row by row in the spawnable's arrays.
+    fn insert_rows(
+        &mut self,
+        first_entity_id: u64,
+        len: u64,
+        spawnable: Spawnable,
+    ) -> Result<(), Error> {
+        match spawnable {
+            Spawnable::Archetypes(archetypes) => {
+                for archetype in archetypes {
+                    for (arr, component) in archetype.arrays.iter().zip(archetype.component_data) {
+                        let component_id = ComponentId::new(&component.name);
+                        let metadata = ComponentMetadata {
+                            component_id,
+                            name: component.name.clone(),
+                            metadata: component.metadata.clone(),
+                        };
+
+                        self.world.metadata.component_map.insert(
+                            component_id,
+                            (ComponentSchema::from(component.clone()), metadata),
+                        );
+                        let buffer = self.world.host.entry(component_id).or_default();
+                        let ty = component.ty.unwrap();
+                        let prim_ty: PrimType = ty.ty.into();
+                        let size = prim_ty.size();
+                        let buf = unsafe { arr.buf(size) };
+                        buffer.buffer.extend_from_slice(buf);
+                        buffer.entity_ids.extend(
+                            (first_entity_id..first_entity_id + len)
+                                .flat_map(|id| id.to_le_bytes()),
+                        );
+                        self.world.dirty_components.insert(component_id);
+                    }
+                }
+                Ok(())
+            }
+        }
+    }
+
+    fn set_entity_id(&mut self, entity_id: EntityId, name: Option<String>, id: Option<String>) {
+        let derived_id = match (&name, id) {
+            (Some(name), None) => {
+                let new_id = name
+                    .without_boundaries(&convert_case::Boundary::digits())
+                    .to_case(convert_case::Case::Snake);
+                info!("convert name {:?} to ID {:?}", &name, &new_id);
+                Some(new_id)
+            }
+            (_, Some(id)) => Some(id),
+            _ => None,
+        };
+
+        if let Some(derived_id) = derived_id {
+            if !is_snake_case(&derived_id) {
+                error!("the ID should be snake_case but was {:?}", derived_id);
+            }
+            self.world.metadata.entity_metadata.insert(
+                entity_id.inner,
+                EntityMetadata {
+                    entity_id: entity_id.inner,
+                    // TODO: Consider changing this `name` field to `id`.
+                    // Perhaps add a human-readable field `display_name` or
+                    // `name` after that.
+                    name: derived_id,
+                    metadata: Default::default(),
+                },
+            );
+        }
+    }
+
     fn build_uncompiled(
         &mut self,
         py: Python<'_>,
@@ -679,10 +757,6 @@ impl WorldBuilder {
         for id in xla_exec.inputs.iter() {
             input_id.push(id.0);
             let component = world.column_by_id(*id).unwrap();
-            let schema = component.schema;
-            let data = component.column;
-            let mut dim = schema.dim.to_vec();
-            dim.insert(0, component.entities.len() / 8);
 
             let comp_name = component.metadata.name.clone();
             dict.set_item(id.0, &comp_name)?;
@@ -694,96 +768,7 @@ impl WorldBuilder {
 
             component_entity_dict.set_item(&comp_name, entity_vec)?;
 
-            match schema.prim_type {
-                PrimType::U8 => {
-                    let slice = <[u8]>::ref_from_bytes(data).unwrap();
-                    let py_array = PyArray::from_slice(py, slice)
-                        .reshape(dim.into_dimension())
-                        .unwrap();
-
-                    state.push(py_array.into_py_any(py)?);
-                }
-                PrimType::U16 => {
-                    let slice = <[u16]>::ref_from_bytes(data).unwrap();
-                    let py_array = PyArray::from_slice(py, slice)
-                        .reshape(dim.into_dimension())
-                        .unwrap();
-
-                    state.push(py_array.into_py_any(py)?);
-                }
-                PrimType::U32 => {
-                    let slice = <[u32]>::ref_from_bytes(data).unwrap();
-                    let py_array = PyArray::from_slice(py, slice)
-                        .reshape(dim.into_dimension())
-                        .unwrap();
-
-                    state.push(py_array.into_py_any(py)?);
-                }
-                PrimType::U64 => {
-                    let slice = <[u64]>::ref_from_bytes(data).unwrap();
-                    let py_array = PyArray::from_slice(py, slice)
-                        .reshape(dim.into_dimension())
-                        .unwrap();
-
-                    state.push(py_array.into_py_any(py)?);
-                }
-                PrimType::I8 => {
-                    let slice = <[i8]>::ref_from_bytes(data).unwrap();
-                    let py_array = PyArray::from_slice(py, slice)
-                        .reshape(dim.into_dimension())
-                        .unwrap();
-
-                    state.push(py_array.into_py_any(py)?);
-                }
-                PrimType::I16 => {
-                    let slice = <[i16]>::ref_from_bytes(data).unwrap();
-                    let py_array = PyArray::from_slice(py, slice)
-                        .reshape(dim.into_dimension())
-                        .unwrap();
-
-                    state.push(py_array.into_py_any(py)?);
-                }
-                PrimType::I32 => {
-                    let slice = <[i32]>::ref_from_bytes(data).unwrap();
-                    let py_array = PyArray::from_slice(py, slice)
-                        .reshape(dim.into_dimension())
-                        .unwrap();
-
-                    state.push(py_array.into_py_any(py)?);
-                }
-                PrimType::I64 => {
-                    let slice = <[i64]>::ref_from_bytes(data).unwrap();
-                    let py_array = PyArray::from_slice(py, slice)
-                        .reshape(dim.into_dimension())
-                        .unwrap();
-
-                    state.push(py_array.into_py_any(py)?);
-                }
-                PrimType::F32 => {
-                    let slice = <[f32]>::ref_from_bytes(data).unwrap();
-                    let py_array = PyArray::from_slice(py, slice)
-                        .reshape(dim.into_dimension())
-                        .unwrap();
-
-                    state.push(py_array.into_py_any(py)?);
-                }
-                PrimType::F64 => {
-                    let slice = <[f64]>::ref_from_bytes(data).unwrap();
-                    let py_array = PyArray::from_slice(py, slice)
-                        .reshape(dim.into_dimension())
-                        .unwrap();
-
-                    state.push(py_array.into_py_any(py)?);
-                }
-                PrimType::Bool => {
-                    let slice = <[bool]>::try_ref_from_bytes(data).unwrap();
-                    let py_array = PyArray::from_slice(py, slice)
-                        .reshape(dim.into_dimension())
-                        .unwrap();
-
-                    state.push(py_array.into_py_any(py)?);
-                }
-            };
+            state.push(column_to_numpy(py, &component)?);
         }
 
         let jax_exec = xla_exec.compile_jax_module(py)?;
@@ -803,6 +788,106 @@ impl WorldBuilder {
     }
 }
 
+/// Copies a column into a numpy array shaped `(entities, *component_shape)`.
+pub(crate) fn column_to_numpy(
+    py: Python<'_>,
+    column: &ColumnRef<'_, &Vec<u8>>,
+) -> Result<Py<PyAny>, Error> {
+    let mut dim = column.schema.dim.to_vec();
+    dim.insert(0, column.entities.len() / 8);
+    let array = match column.schema.prim_type {
+        PrimType::U8 => {
+            let slice = <[u8]>::ref_from_bytes(column.column).unwrap();
+            let py_array = PyArray::from_slice(py, slice)
+                .reshape(dim.into_dimension())
+                .unwrap();
+
+            py_array.into_py_any(py)?
+        }
+        PrimType::U16 => {
+            let slice = <[u16]>::ref_from_bytes(column.column).unwrap();
+            let py_array = PyArray::from_slice(py, slice)
+                .reshape(dim.into_dimension())
+                .unwrap();
+
+            py_array.into_py_any(py)?
+        }
+        PrimType::U32 => {
+            let slice = <[u32]>::ref_from_bytes(column.column).unwrap();
+            let py_array = PyArray::from_slice(py, slice)
+                .reshape(dim.into_dimension())
+                .unwrap();
+
+            py_array.into_py_any(py)?
+        }
+        PrimType::U64 => {
+            let slice = <[u64]>::ref_from_bytes(column.column).unwrap();
+            let py_array = PyArray::from_slice(py, slice)
+                .reshape(dim.into_dimension())
+                .unwrap();
+
+            py_array.into_py_any(py)?
+        }
+        PrimType::I8 => {
+            let slice = <[i8]>::ref_from_bytes(column.column).unwrap();
+            let py_array = PyArray::from_slice(py, slice)
+                .reshape(dim.into_dimension())
+                .unwrap();
+
+            py_array.into_py_any(py)?
+        }
+        PrimType::I16 => {
+            let slice = <[i16]>::ref_from_bytes(column.column).unwrap();
+            let py_array = PyArray::from_slice(py, slice)
+                .reshape(dim.into_dimension())
+                .unwrap();
+
+            py_array.into_py_any(py)?
+        }
+        PrimType::I32 => {
+            let slice = <[i32]>::ref_from_bytes(column.column).unwrap();
+            let py_array = PyArray::from_slice(py, slice)
+                .reshape(dim.into_dimension())
+                .unwrap();
+
+            py_array.into_py_any(py)?
+        }
+        PrimType::I64 => {
+            let slice = <[i64]>::ref_from_bytes(column.column).unwrap();
+            let py_array = PyArray::from_slice(py, slice)
+                .reshape(dim.into_dimension())
+                .unwrap();
+
+            py_array.into_py_any(py)?
+        }
+        PrimType::F32 => {
+            let slice = <[f32]>::ref_from_bytes(column.column).unwrap();
+            let py_array = PyArray::from_slice(py, slice)
+                .reshape(dim.into_dimension())
+                .unwrap();
+
+            py_array.into_py_any(py)?
+        }
+        PrimType::F64 => {
+            let slice = <[f64]>::ref_from_bytes(column.column).unwrap();
+            let py_array = PyArray::from_slice(py, slice)
+                .reshape(dim.into_dimension())
+                .unwrap();
+
+            py_array.into_py_any(py)?
+        }
+        PrimType::Bool => {
+            let slice = <[bool]>::try_ref_from_bytes(column.column).unwrap();
+            let py_array = PyArray::from_slice(py, slice)
+                .reshape(dim.into_dimension())
+                .unwrap();
+
+            py_array.into_py_any(py)?
+        }
+    };
+    Ok(array)
+}
+
 #[cfg(test)]
 mod test {
     use super::*;
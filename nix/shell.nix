@@ -20,6 +20,7 @@
       python3Packages.jaxlib
       python3Packages.typing-extensions
       python3Packages.pytest
+      python3Packages.pytest-xdist
       python3Packages.matplotlib
       python3Packages.polars
       openssl
@@ -69,6 +70,7 @@
       ruff
       python3Packages.pytest
       python3Packages.pytest-json-report
+      python3Packages.pytest-xdist
       config.packages.elodin-py
     ];
   };